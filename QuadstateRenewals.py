@@ -1,275 +1,366 @@
+import atexit
+import importlib.util
+import io
 import os
-import shutil
+import queue
+import threading
 import time
 import tkinter as tk
 from tkinter import ttk, filedialog
-from win32com.client import constants
-import win32com.client as win32
-import pandas as pd
+import msoffcrypto
+from msoffcrypto.format.ooxml import OOXMLFile
 from ttkbootstrap import Style
 import logging
+from logging.handlers import MemoryHandler
 import colorlog
 
-# Set up logging with colorlog for console and file logging
-handler = logging.StreamHandler()
-handler.setFormatter(colorlog.ColoredFormatter(
-    "%(log_color)s%(asctime)s - %(levelname)s - %(message)s",
-    log_colors={
-        'DEBUG': 'cyan',
-        'INFO': 'green',
-        'WARNING': 'yellow',
-        'ERROR': 'red',
-        'CRITICAL': 'bold_red',
-    }
-))
-
-file_handler = logging.FileHandler('app.log', mode='w')
-file_handler.setFormatter(logging.Formatter(
-    "%(asctime)s - %(levelname)s - %(message)s"
-))
-
-logging.basicConfig(level=logging.DEBUG, handlers=[handler, file_handler])
-
-def clear_com_cache():
-    logging.debug('Clearing COM cache.')
-    gen_py_path = os.path.join(os.environ.get('LOCALAPPDATA'), 'Temp', 'gen_py')
-    if os.path.exists(gen_py_path):
-        shutil.rmtree(gen_py_path)
-        logging.info('COM cache cleared.')
-
-def open_protected_excel(file_path, temp_file_path, password):
-    logging.debug(f'Attempting to open Excel file: {file_path}')
-    clear_com_cache()
-    excel = win32.gencache.EnsureDispatch('Excel.Application')
-    excel.DisplayAlerts = False
-    try:
-        if password:
-            logging.debug('Opening Excel file with password protection.')
-            wb = excel.Workbooks.Open(file_path, Password=password)
+# python-calamine parses xlsx and xls in Rust; without it pandas picks its own engine from the file contents.
+EXCEL_READ_ENGINE = 'calamine' if importlib.util.find_spec('python_calamine') else None
+
+STATE_FORMATS = {
+    'Renewal Complete': {'bg_color': '#90EE90'},
+    'Nowcerts Complete': {'bg_color': '#36bbe9'},
+    'Needs Rewritten': {'bg_color': '#EAE455'},
+    'Needs Spoke To': {'bg_color': '#9999FF'},
+    'Non Renewing': {'bg_color': '#ff6666'},
+    'Canceled': {'bg_color': '#A9A9A9'}  # Dark gray color for "Canceled" state
+}
+
+# Blank columns the team fills in by hand; export_to_excel adds them after the data columns.
+TRACKING_COLUMNS = ['State', 'Notes Filed', 'Completed By']
+
+OLE_SIGNATURE = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+# Set up logging with colorlog for console and file logging. Called from the entry point so that
+# importing the module doesn't truncate app.log or reconfigure the root logger.
+def setup_logging():
+    handler = logging.StreamHandler()
+    handler.setFormatter(colorlog.ColoredFormatter(
+        "%(log_color)s%(asctime)s - %(levelname)s - %(message)s",
+        log_colors={
+            'DEBUG': 'cyan',
+            'INFO': 'green',
+            'WARNING': 'yellow',
+            'ERROR': 'red',
+            'CRITICAL': 'bold_red',
+        }
+    ))
+
+    file_handler = logging.FileHandler('app.log', mode='w')
+    file_handler.setFormatter(logging.Formatter(
+        "%(asctime)s - %(levelname)s - %(message)s"
+    ))
+
+    # Batch file writes; errors still reach app.log immediately and the rest is flushed on exit.
+    buffered_file_handler = MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=file_handler)
+    atexit.register(buffered_file_handler.flush)
+
+    # LOG_LEVEL picks the verbosity (INFO by default); QSR_DEBUG=1 still forces the full debug trace.
+    # Accepts level names (case-insensitive) or numbers; anything else falls back to INFO.
+    log_level_name = os.getenv('LOG_LEVEL', 'INFO').strip().upper()
+    if log_level_name.isdigit():
+        log_level = int(log_level_name)
+    else:
+        # getLevelName maps a registered name to its number and returns a string for anything else.
+        log_level = logging.getLevelName(log_level_name)
+        if not isinstance(log_level, int):
+            log_level = logging.INFO
+    if os.getenv('QSR_DEBUG'):
+        log_level = logging.DEBUG
+    logging.basicConfig(level=log_level, handlers=[handler, buffered_file_handler])
+
+def decrypt_excel_file(file_path, password):
+    logging.debug('Decrypting Excel file in memory: %s', file_path)
+    with open(file_path, 'rb') as encrypted_file:
+        office_file = msoffcrypto.OfficeFile(encrypted_file)
+        if not office_file.is_encrypted():
+            logging.debug('Excel file is not encrypted, ignoring the password.')
+            return file_path
+        if not password:
+            raise msoffcrypto.exceptions.InvalidKeyError('Excel file is password protected.')
+        if isinstance(office_file, OOXMLFile):
+            office_file.load_key(password=password, verify_password=True)
         else:
-            logging.debug('Opening Excel file without password protection.')
-            wb = excel.Workbooks.Open(file_path)
-        wb.SaveAs(temp_file_path, Password='')
-        wb.Close(SaveChanges=True)
-        logging.info('Excel file opened and saved without password.')
-        return wb
-    except Exception as e:
-        logging.error(f"Failed to open the Excel file: {e}")
-        return False
-    finally:
-        excel.Quit()
-
-def read_excel_file(file_path, password=None):
-    logging.debug(f'Reading Excel file: {file_path}')
-    temp_file_path = os.path.join(os.environ.get('TEMP'), "~$temp.xlsx")
-    logging.debug(f'Temporary file path: {temp_file_path}')
-    success = open_protected_excel(file_path, temp_file_path, password)
-    if not success:
-        logging.warning('Failed to read the Excel file. Possible incorrect password.')
-        return None
+            # Legacy .xls load_key has no verify_password; a wrong password surfaces from decrypt instead.
+            office_file.load_key(password=password)
+        decrypted_file = io.BytesIO()
+        office_file.decrypt(decrypted_file)
+    decrypted_file.seek(0)
+    return decrypted_file
+
+def read_excel_file(file_path, password=None, usecols=None, dtype=None):
+    import pandas as pd
+    logging.debug('Reading Excel file with %s: %s', EXCEL_READ_ENGINE or 'the default engine', file_path)
+    source = file_path
     try:
-        df = pd.read_excel(temp_file_path)
-        logging.info('Excel file read into DataFrame.')
-        return df
+        with open(file_path, 'rb') as excel_file:
+            signature = excel_file.read(len(OLE_SIGNATURE))
+        # Encrypted workbooks are wrapped in an OLE container; plain .xlsx files are zip archives.
+        if signature == OLE_SIGNATURE:
+            source = decrypt_excel_file(file_path, password)
+        else:
+            logging.debug('Excel file is not an OLE container, reading it directly.')
+        df = pd.read_excel(source, engine=EXCEL_READ_ENGINE, usecols=usecols, dtype=dtype)
     except FileNotFoundError:
         logging.error('Error: Input file not found.')
         return None
-    finally:
-        if os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
-            logging.debug('Temporary file removed.')
+    except msoffcrypto.exceptions.InvalidKeyError:
+        logging.warning('Failed to decrypt the Excel file. Possible incorrect password.')
+        return None
+    except (msoffcrypto.exceptions.FileFormatError, msoffcrypto.exceptions.DecryptionError) as e:
+        logging.error('Failed to decrypt the Excel file: %s', e)
+        return None
+    except ValueError as e:
+        logging.error('Failed to parse the Excel file: %s', e)
+        return None
+    logging.info('Excel file read into DataFrame.')
+    return df
 
 def check_required_columns(df, required_columns):
     logging.debug('Checking for required columns in DataFrame.')
-    missing_columns = [col for col in required_columns if col not in df.columns]
+    columns = frozenset(df.columns)
+    missing_columns = [col for col in required_columns if col not in columns]
     if missing_columns:
-        logging.error(f"The following columns are missing in the input file: {missing_columns}")
+        logging.error("The following columns are missing in the input file: %s", missing_columns)
         return False
     logging.info('All required columns are present.')
     return True
 
 def export_to_excel(df, output_file_path, state_dropdown, notes_dropdown, completed_by_dropdown):
-    logging.debug(f'Exporting DataFrame to Excel file: {output_file_path}')
-    writer = pd.ExcelWriter(output_file_path, engine='xlsxwriter')
-    workbook = writer.book
-    workbook.use_zip64()
-    workbook.nan_inf_to_errors = True
-    df.to_excel(writer, index=False)
-    worksheet = writer.sheets['Sheet1']
+    import pandas as pd
+    import xlsxwriter
+    from xlsxwriter.utility import xl_col_to_name, xl_range, xl_range_abs
+    logging.debug('Exporting DataFrame to Excel file: %s', output_file_path)
+    # constant_memory streams each row to disk as soon as the next one starts, so everything
+    # below must be set up before the data and the rows must be written strictly in order.
+    workbook = xlsxwriter.Workbook(output_file_path, {'constant_memory': True,
+                                                      'use_zip64': True,
+                                                      'nan_inf_to_errors': True,
+                                                      'default_date_format': 'yyyy-mm-dd hh:mm:ss'})
+    worksheet = workbook.add_worksheet('Sheet1')
+
+    # Dropdown values are written once to a hidden sheet and referenced by name from the validations.
+    lists_sheet = workbook.add_worksheet('Lists')
+    lists_sheet.hide()
+    dropdown_lists = {'States': state_dropdown, 'NotesFiled': notes_dropdown, 'CompletedBy': completed_by_dropdown}
+    for row, (list_name, values) in enumerate(dropdown_lists.items()):
+        lists_sheet.write_row(row, 0, values)
+        workbook.define_name(list_name, f'=Lists!{xl_range_abs(row, 0, row, len(values) - 1)}')
+
+    header_format = workbook.add_format({'bold': True, 'bg_color': '#368be9', 'align': 'center', 'valign': 'vcenter'})
+    grey_format = workbook.add_format({'bg_color': '#f0f0f0'})
+    notes_format = workbook.add_format({'align': 'center'})
+
+    columns = df.columns.tolist() + TRACKING_COLUMNS
+    col_positions = {column: col_idx for col_idx, column in enumerate(columns)}
 
     logging.debug('Setting up data validation for dropdowns.')
-    state_col_letter = chr(ord('A') + df.columns.get_loc('State'))
-    state_range = f'{state_col_letter}2:{state_col_letter}{len(df) + 1}'
-    worksheet.data_validation(state_range, {'validate': 'list', 'source': state_dropdown})
+    state_col = col_positions['State']
+    state_col_letter = xl_col_to_name(state_col)
+    state_range = xl_range(1, state_col, len(df), state_col)
+    worksheet.data_validation(state_range, {'validate': 'list', 'source': '=States'})
 
-    notes_col_letter = chr(ord('A') + df.columns.get_loc('Notes Filed'))
-    notes_range = f'{notes_col_letter}2:{notes_col_letter}{len(df) + 1}'
-    worksheet.data_validation(notes_range, {'validate': 'list', 'source': notes_dropdown})
+    notes_col = col_positions['Notes Filed']
+    notes_range = xl_range(1, notes_col, len(df), notes_col)
+    worksheet.data_validation(notes_range, {'validate': 'list', 'source': '=NotesFiled'})
 
-    completed_by_col_letter = chr(ord('A') + df.columns.get_loc('Completed By'))
-    completed_by_range = f'{completed_by_col_letter}2:{completed_by_col_letter}{len(df) + 1}'
-    worksheet.data_validation(completed_by_range, {'validate': 'list', 'source': completed_by_dropdown})
+    completed_by_col = col_positions['Completed By']
+    completed_by_range = xl_range(1, completed_by_col, len(df), completed_by_col)
+    worksheet.data_validation(completed_by_range, {'validate': 'list', 'source': '=CompletedBy'})
 
     logging.debug('Setting column widths and formats.')
-    for column in df.columns:
-        column_width = 16 if column in ['State', 'Notes Filed', 'Completed By'] else (
-            50 if column == 'Notes' else max(df[column].astype(str).map(len).max(), len(column)))
-        col_idx = df.columns.get_loc(column)
-        worksheet.set_column(col_idx, col_idx, column_width)
+    fixed_widths = {'State': 16, 'Notes Filed': 16, 'Completed By': 16, 'Notes': 50}
+    for col_idx, column in enumerate(columns):
+        if column in fixed_widths:
+            column_width = fixed_widths[column]
+        else:
+            longest = df[column].astype('string').str.len().max()
+            column_width = min(60, max(len(column), 0 if pd.isna(longest) else int(longest)))
+        column_format = notes_format if col_idx == notes_col else None
+        worksheet.set_column(col_idx, col_idx, column_width, column_format)
 
-    header_format = workbook.add_format({'bold': True, 'bg_color': '#368be9', 'align': 'center', 'valign': 'vcenter'})
-    for col_num, value in enumerate(df.columns.values):
-        worksheet.write(0, col_num, value, header_format)
-
-    state_format = {
-        'Renewal Complete': {'bg_color': '#90EE90'},
-        'Nowcerts Complete': {'bg_color': '#36bbe9'},
-        'Needs Rewritten': {'bg_color': '#EAE455'},
-        'Needs Spoke To': {'bg_color': '#9999FF'},
-        'Non Renewing': {'bg_color': '#ff6666'},
-        'Canceled': {'bg_color': '#A9A9A9'}  # Dark gray color for "Canceled" state
-    }
+    worksheet.write_row(0, 0, columns, header_format)
 
     logging.debug('Applying conditional formatting based on state.')
-    for state, format_spec in state_format.items():
+    data_range = xl_range(1, 0, len(df), len(columns) - 1)
+    for state, format_spec in STATE_FORMATS.items():
         format_ = workbook.add_format(format_spec)
-        for row in range(1, len(df) + 1):
-            worksheet.conditional_format(f'A{row + 1}:{chr(ord("A") + len(df.columns) - 1)}{row + 1}',
-                                         {'type': 'formula',
-                                          'criteria': f'INDIRECT("${state_col_letter}${row + 1}")="{state}"',
-                                          'format': format_})
-
-    notes_format = workbook.add_format({'align': 'center'})
-    notes_col_index = df.columns.get_loc('Notes Filed')
-    for row in range(1, len(df) + 1):
-        cell_value = df.iloc[row - 1, notes_col_index]
-        worksheet.write(row, notes_col_index, cell_value, notes_format)
-
-    grey_format = workbook.add_format({'bg_color': '#f0f0f0'})
-    for row in range(1, len(df) + 1, 2):
-        for col in range(len(df.columns)):
-            cell_format = grey_format if col != notes_col_index else \
-                workbook.add_format({'bg_color': '#f0f0f0', 'align': 'center'})
-            worksheet.write(row, col, df.iloc[row - 1, col], cell_format)
-
-    writer.close()
-    logging.info(f'DataFrame exported to {output_file_path}')
+        worksheet.conditional_format(data_range, {'type': 'formula',
+                                                  'criteria': f'=${state_col_letter}2="{state}"',
+                                                  'format': format_,
+                                                  'stop_if_true': True})
+
+    # Added last: rows with a state stop at their state rule, so only unassigned rows reach the stripe.
+    worksheet.conditional_format(data_range, {'type': 'formula',
+                                              'criteria': '=MOD(ROW(),2)=0',
+                                              'format': grey_format})
+
+    # Only the data columns are written; the tracking cells stay empty but keep their validation and formatting.
+    logging.debug('Writing data rows.')
+    rows = df.astype(object).where(df.notna(), None).to_numpy().tolist()
+    for row, row_values in enumerate(rows, start=1):
+        worksheet.write_row(row, 0, row_values)
+
+    workbook.close()
+    logging.info('DataFrame exported to %s', output_file_path)
     return True
 
 def update_count_label(label, count):
     label.config(text=f"Files processed: {count}")
-    logging.info(f'Updated count label to: Files processed: {count}')
+    logging.info('Updated count label to: Files processed: %s', count)
+
+# Callables queued by the worker thread, run on the Tk thread by process_ui_queue.
+ui_queue = queue.Queue()
+
+def process_ui_queue():
+    while True:
+        try:
+            callback = ui_queue.get_nowait()
+        except queue.Empty:
+            break
+        callback()
+    root.after(100, process_ui_queue)
+
+def finish_processing(count):
+    update_count_label(count_label, count)
+    # Leave the count on screen for a moment without blocking the event loop.
+    root.after(3000, root.destroy)
 
 def process_excel():
     logging.debug('Starting Excel processing.')
     incorrect_password_label.config(text="")
-    root.update_idletasks()
+    process_button.config(state='disabled')
 
     input_file_path = source_var.get()
     output_folder_path = destination_var.get()
     password = password_var.get()
 
-    logging.debug(f'Input file path: {input_file_path}')
-    logging.debug(f'Output folder path: {output_folder_path}')
+    logging.debug('Input file path: %s', input_file_path)
+    logging.debug('Output folder path: %s', output_folder_path)
 
+    # Run the read/export off the Tk thread so the window keeps responding; the worker
+    # never touches widgets itself and hands UI updates back through ui_queue.
+    threading.Thread(target=process_excel_worker, args=(input_file_path, output_folder_path, password),
+                     daemon=True).start()
+
+def process_excel_worker(input_file_path, output_folder_path, password):
     try:
-        df = read_excel_file(input_file_path, password)
+        # pandas is imported here, off the Tk thread, so loading it doesn't hold up the first paint.
+        import pandas as pd
+        required_columns = ['Expiration Date', 'Insured', 'Carrier',
+                            'Lines Of Business', 'Status', 'Premium', 'Renewal Premium', 'Percentage Change']
+        # A callable usecols skips the other columns without raising on missing ones, so
+        # check_required_columns can still report exactly what the export is lacking.
+        df = read_excel_file(input_file_path, password, usecols=lambda column: column in required_columns,
+                             dtype={'Insured': 'string', 'Carrier': 'string', 'Lines Of Business': 'string',
+                                    'Status': 'category'})
         if df is None:
-            incorrect_password_label.config(text="Incorrect password. Please try again.")
-            root.update_idletasks()
+            ui_queue.put(lambda: incorrect_password_label.config(text="Incorrect password. Please try again."))
             return
 
-        required_columns = ['Expiration Date', 'Insured', 'Carrier',
-                            'Lines Of Business', 'Status', 'Premium', 'Renewal Premium', 'Percentage Change']
         if not check_required_columns(df, required_columns):
             return
+        # Sorting a datetime64 column stays in NumPy; an object column would compare in Python.
+        df['Expiration Date'] = pd.to_datetime(df['Expiration Date'], errors='coerce')
 
-        logging.debug('Renaming and selecting required columns.')
-        df.rename(columns={'Insured': 'Insured Name'}, inplace=True)
-        df = df[['Expiration Date', 'Insured Name', 'Carrier', 'Lines Of Business', 'Status', 'Premium',
-                 'Renewal Premium', 'Percentage Change']]
-        df['State'] = ""
-        df['Notes Filed'] = ""
-        df['Completed By'] = ""
+        logging.debug('Selecting, renaming and sorting required columns.')
+        # The tracking columns are not part of the frame; export_to_excel appends them as blank cells.
+        df = (df[required_columns]
+              .rename(columns={'Insured': 'Insured Name'})
+              .sort_values(by='Expiration Date', kind='stable', ignore_index=True))
 
         state_dropdown = ['Renewal Complete', 'Nowcerts Complete', 'Needs Rewritten', 'Needs Spoke To', 'Non Renewing', 'Canceled']
         notes_dropdown = ['Yes', 'No', 'Left VM', 'Sent Email']
         completed_by_dropdown = ['Danielle Stevens', 'Amber Miller', 'Teresa Morrisette', 'Lane Ross']
 
-        df.sort_values(by='Expiration Date', inplace=True)
         output_file_path = os.path.join(output_folder_path, f"Updated_Renewals_{time.strftime('%Y%m%d-%H%M%S')}.xlsx")
         if export_to_excel(df, output_file_path, state_dropdown, notes_dropdown, completed_by_dropdown):
-            update_count_label(count_label, len(df))
-            root.update_idletasks()
-            time.sleep(3)
-            root.destroy()
+            processed_count = len(df)
+            ui_queue.put(lambda: finish_processing(processed_count))
     except Exception as e:
-        logging.error(f"Error: {e}")
-        incorrect_password_label.config(text="Incorrect password. Please, try again.")
-        root.update_idletasks()
+        logging.error("Error: %s", e)
+        ui_queue.put(lambda: incorrect_password_label.config(text="Incorrect password. Please, try again."))
+    finally:
+        ui_queue.put(lambda: process_button.config(state='normal'))
 
 def select_source_file():
     file_path = filedialog.askopenfilename(filetypes=[("Excel files", "*.xlsx;*.xls")])
     source_var.set(file_path)
-    logging.debug(f'Source file selected: {file_path}')
+    logging.debug('Source file selected: %s', file_path)
 
 def select_destination_folder():
     folder_path = filedialog.askdirectory()
     destination_var.set(folder_path)
-    logging.debug(f'Destination folder selected: {folder_path}')
-
-root = tk.Tk()
-root.title("Quadstate Renewal Processor")
-root.geometry('450x400')
-
-style = Style(theme='flatly')
-
-logging.debug('Setting default file paths.')
-if os.path.exists(os.path.join("C:\\", "Users", os.getlogin(), "Downloads", "Copy of Export_RenewalCenter.xlsx")):
-    default_input_file = os.path.join("C:\\", "Users", os.getlogin(), "Downloads", "Copy of Export_RenewalCenter.xlsx")
-elif os.path.exists(os.path.join("C:\\", "Users", os.getlogin(), "Downloads", "Export_RenewalCenter.xlsx")):
-    default_input_file = os.path.join("C:\\", "Users", os.getlogin(), "Downloads", "Export_RenewalCenter.xlsx")
-else:
-    default_input_file = ''
-
-if os.path.exists(os.path.join("C:\\", "Users", os.getlogin(), "OneDrive - quadstateinsurance.com", "Desktop")):
-    default_output_folder = os.path.join("C:\\", "Users", os.getlogin(), "OneDrive - quadstateinsurance.com", "Desktop")
-elif os.path.exists(os.path.join("C:\\", "Users", os.getlogin(), "Desktop")):
-    default_output_folder = os.path.join("C:\\", "Users", os.getlogin(), "Desktop")
-else:
-    default_output_folder = ''
-
-source_var = tk.StringVar(value=default_input_file)
-source_label = ttk.Label(root, text="Select source file:")
-source_label.pack(pady=(10, 0))
-source_entry = ttk.Entry(root, textvariable=source_var, width=70)
-source_entry.pack()
-source_button = ttk.Button(root, text="Browse", command=select_source_file)
-source_button.pack(pady=5)
-
-destination_var = tk.StringVar(value=default_output_folder)
-destination_label = ttk.Label(root, text="Select destination folder:")
-destination_label.pack(pady=(10, 0))
-destination_entry = ttk.Entry(root, textvariable=destination_var, width=70)
-destination_entry.pack()
-destination_button = ttk.Button(root, text="Browse", command=select_destination_folder)
-destination_button.pack(pady=5)
-
-password_var = tk.StringVar()
-password_label = ttk.Label(root, text="Enter file password (if any):")
-password_label.pack(pady=(10, 0))
-password_entry = ttk.Entry(root, textvariable=password_var, show="*")
-password_entry.pack(pady=5)
-
-count_label = ttk.Label(root, text="Files processed: 0")
-count_label.pack(pady=(10, 0))
-
-incorrect_password_label = ttk.Label(root, text="", style="danger.TLabel")
-incorrect_password_label.pack(pady=(5, 0))
-
-style.theme_use('superhero')
-
-process_button = ttk.Button(root, text="Process", command=process_excel)
-process_button.pack(pady=10)
-
-root.mainloop()
+    logging.debug('Destination folder selected: %s', folder_path)
+
+# Maps casefolded entry names to the names on disk, so lookups match Windows' case-insensitive paths.
+def list_directory(path):
+    try:
+        return {entry.name.casefold(): entry.name for entry in os.scandir(path)}
+    except OSError:
+        return {}
+
+if __name__ == '__main__':
+    setup_logging()
+
+    root = tk.Tk()
+    root.title("Quadstate Renewal Processor")
+    root.geometry('450x400')
+
+    style = Style(theme='flatly')
+
+    logging.debug('Setting default file paths.')
+    user_home = os.path.expanduser('~')
+    downloads_path = os.path.join(user_home, "Downloads")
+    downloads = list_directory(downloads_path)
+    input_candidates = ("Copy of Export_RenewalCenter.xlsx", "Export_RenewalCenter.xlsx")
+    default_input_file = next((os.path.join(downloads_path, downloads[name.casefold()])
+                               for name in input_candidates if name.casefold() in downloads), '')
+
+    home_entries = list_directory(user_home)
+    onedrive_name = home_entries.get("OneDrive - quadstateinsurance.com".casefold())
+    onedrive_desktop = os.path.join(user_home, onedrive_name, "Desktop") if onedrive_name else ''
+    desktop_name = home_entries.get("Desktop".casefold())
+    desktop = os.path.join(user_home, desktop_name) if desktop_name else ''
+    if onedrive_desktop and os.path.isdir(onedrive_desktop):
+        default_output_folder = onedrive_desktop
+    elif desktop and os.path.isdir(desktop):
+        default_output_folder = desktop
+    else:
+        default_output_folder = ''
+
+    source_var = tk.StringVar(value=default_input_file)
+    source_label = ttk.Label(root, text="Select source file:")
+    source_label.pack(pady=(10, 0))
+    source_entry = ttk.Entry(root, textvariable=source_var, width=70)
+    source_entry.pack()
+    source_button = ttk.Button(root, text="Browse", command=select_source_file)
+    source_button.pack(pady=5)
+
+    destination_var = tk.StringVar(value=default_output_folder)
+    destination_label = ttk.Label(root, text="Select destination folder:")
+    destination_label.pack(pady=(10, 0))
+    destination_entry = ttk.Entry(root, textvariable=destination_var, width=70)
+    destination_entry.pack()
+    destination_button = ttk.Button(root, text="Browse", command=select_destination_folder)
+    destination_button.pack(pady=5)
+
+    password_var = tk.StringVar()
+    password_label = ttk.Label(root, text="Enter file password (if any):")
+    password_label.pack(pady=(10, 0))
+    password_entry = ttk.Entry(root, textvariable=password_var, show="*")
+    password_entry.pack(pady=5)
+
+    count_label = ttk.Label(root, text="Files processed: 0")
+    count_label.pack(pady=(10, 0))
+
+    incorrect_password_label = ttk.Label(root, text="", style="danger.TLabel")
+    incorrect_password_label.pack(pady=(5, 0))
+
+    style.theme_use('superhero')
+
+    process_button = ttk.Button(root, text="Process", command=process_excel)
+    process_button.pack(pady=10)
+
+    root.after(100, process_ui_queue)
+    root.mainloop()